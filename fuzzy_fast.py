@@ -0,0 +1,240 @@
+from numba import njit, types
+
+# =====Функции принадлежности (из NavigationController._configure_membership)=====
+# Для позиции по X
+FAR_BACK = (-2.0, -1.5, -0.25, -0.20)
+NEAR_BACK = (-0.25, -0.2, -0.04, 0.0)
+CENTER = (-0.04, 0.0, 0.04)
+NEAR_FRONT = (0.0, 0.04, 0.2, 0.25)
+FAR_FRONT = (0.20, 0.25, 1.5, 2.0)
+# Границы universe np.arange(-2, 2, 0.01): отклонения за ними ограничиваются, как clip_to_bounds в skfuzzy
+POSITION_MIN = -2.0
+POSITION_MAX = 1.99
+
+# Для позиции по Y (те же параметры: Y- = right, Y+ = left)
+FAR_RIGHT = FAR_BACK
+NEAR_RIGHT = NEAR_BACK
+NEAR_LEFT = NEAR_FRONT
+FAR_LEFT = FAR_FRONT
+
+# Для сенсоров
+SENSOR_LIMIT = 0.41  # Максимальное расстояние сенсоров
+DANGEROUS = (0.0, 0.0, 0.20, 0.25)
+# Терм safe (трапеция [0.20, 0.25, 0.41, 0.41]) на [0, SENSOR_LIMIT] равен 1 - dangerous
+
+# =====Синглтоны выходных скоростей: (центр плато трапеции, площадь терма)=====
+# Площадь задаёт вес синглтона, как в центроиде skfuzzy: узкий терм stop
+# не перетягивает соседний широкий терм
+BACKWARD_FAST = (-0.26, 0.09)
+BACKWARD_MED = (-0.16, 0.10)
+BACKWARD_SLOW = (-0.0625, 0.0975)
+STOP = (0.0, 0.025)
+FORWARD_SLOW = (0.0625, 0.0975)
+FORWARD_MED = (0.16, 0.10)
+FORWARD_FAST = (0.26, 0.09)
+
+RIGHT_FAST = BACKWARD_FAST
+RIGHT_MED = BACKWARD_MED
+RIGHT_SLOW = BACKWARD_SLOW
+LEFT_SLOW = FORWARD_SLOW
+LEFT_MED = FORWARD_MED
+LEFT_FAST = FORWARD_FAST
+
+# Сигнатура evaluate: (dx, dy, 7 сенсоров) -> (vx, vy). Задана явно, чтобы компиляция
+# выполнялась при импорте модуля, а не на первом такте движения
+EVALUATE_SIGNATURE = types.UniTuple(types.float64, 2)(*([types.float64] * 9))
+
+
+@njit(cache=True, fastmath=True)
+def trapmf_scalar(x, a, b, c, d):
+    """Трапециевидная функция принадлежности для одного значения."""
+    if x < b:
+        if x <= a:
+            return 0.0
+        return (x - a) / (b - a)
+    if x <= c:
+        return 1.0
+    if x < d:
+        return (d - x) / (d - c)
+    return 0.0
+
+
+@njit(cache=True, fastmath=True)
+def trimf_scalar(x, a, b, c):
+    """Треугольная функция принадлежности для одного значения."""
+    if x <= a or x >= c:
+        return 1.0 if x == b else 0.0
+    if x < b:
+        return (x - a) / (b - a)
+    return (c - x) / (c - b)
+
+
+@njit(cache=True, fastmath=True)
+def _sensor_mf(x):
+    """Степени (dangerous, safe) для показания сенсора."""
+    # Показание ограничивается диапазоном сенсора; на нём термы дополняют друг друга
+    dangerous = trapmf_scalar(min(max(x, 0.0), SENSOR_LIMIT), *DANGEROUS)
+    return dangerous, 1.0 - dangerous
+
+
+@njit(cache=True, fastmath=True)
+def _clip_position(x):
+    """Ограничение отклонения диапазоном позиции."""
+    return min(max(x, POSITION_MIN), POSITION_MAX)
+
+
+@njit(cache=True, fastmath=True)
+def _goal_scales(dx, dy):
+    """Коэффициенты скоростей к цели (k_x, k_y): второстепенная ось замедляется."""
+    main_axis = max(abs(dx), abs(dy), 1e-4)  # определение наибольшего параметра
+    scale_factor = min(abs(dx), abs(dy)) / main_axis  # Поправочный коэффициент
+    if abs(dx) > abs(dy):
+        return 1.0, scale_factor
+    return scale_factor, 1.0
+
+
+@njit(cache=True, fastmath=True)
+def _aggregate(rules, gate, scale):
+    """Сумма весов и взвешенных центров: rules - пары (вес, синглтон)."""
+    total = 0.0
+    acc = 0.0
+    for weight, term in rules:
+        center, area = term
+        weight = min(weight, gate) * area
+        total += weight
+        acc += weight * center * scale
+    return total, acc
+
+
+@njit(cache=True, fastmath=True)
+def _aggregate_xy(rules, gate):
+    """Суммы весов и взвешенных центров по осям: rules - тройки (вес, синглтон X, синглтон Y)."""
+    total_x = 0.0
+    total_y = 0.0
+    acc_x = 0.0
+    acc_y = 0.0
+    for weight, term_x, term_y in rules:
+        weight = min(weight, gate)
+        center_x, area_x = term_x
+        center_y, area_y = term_y
+        total_x += weight * area_x
+        total_y += weight * area_y
+        acc_x += weight * area_x * center_x
+        acc_y += weight * area_y * center_y
+    return total_x, total_y, acc_x, acc_y
+
+
+@njit(cache=True, fastmath=True)
+def _defuzzify(total, acc):
+    """Взвешенное среднее синглтонов с ограничением до ±0.3 м/с."""
+    if total == 0.0:  # Ни одно правило не сработало
+        return 0.0
+    return min(max(acc / total, -0.3), 0.3)
+
+
+@njit(EVALUATE_SIGNATURE, cache=True, fastmath=True)
+def evaluate(dx, dy, left_front, left_rear, front, right_front,
+             right_rear, back_left, back_right):
+    """Единая база правил: движение к цели и обход препятствий. Возвращает (vx, vy)."""
+    # Фаззификация: каждый терм вычисляется один раз за такт
+    lf_d, lf_s = _sensor_mf(left_front)
+    lr_d, lr_s = _sensor_mf(left_rear)
+    f_d, f_s = _sensor_mf(front)
+    rf_d, rf_s = _sensor_mf(right_front)
+    rr_d, rr_s = _sensor_mf(right_rear)
+    bl_d, bl_s = _sensor_mf(back_left)
+    br_d, br_s = _sensor_mf(back_right)
+
+    # Ближайшее препятствие (min_sensor) выбирает режим: dangerous - обход, safe - к цели
+    min_d, min_s = _sensor_mf(min(left_front, left_rear, front, right_front,
+                                  right_rear, back_left, back_right))
+
+    px = _clip_position(dx)
+    py = _clip_position(dy)
+    x_far_back = trapmf_scalar(px, *FAR_BACK)
+    x_near_back = trapmf_scalar(px, *NEAR_BACK)
+    x_center = trimf_scalar(px, *CENTER)
+    x_near_front = trapmf_scalar(px, *NEAR_FRONT)
+    x_far_front = trapmf_scalar(px, *FAR_FRONT)
+    y_far_right = trapmf_scalar(py, *FAR_RIGHT)
+    y_near_right = trapmf_scalar(py, *NEAR_RIGHT)
+    y_center = trimf_scalar(py, *CENTER)
+    y_near_left = trapmf_scalar(py, *NEAR_LEFT)
+    y_far_left = trapmf_scalar(py, *FAR_LEFT)
+
+    # Правила движения к цели (каждое влияет только на свою ось)
+    scale_x, scale_y = _goal_scales(dx, dy)
+    goal_wx, goal_ax = _aggregate((
+        (x_far_back, BACKWARD_FAST),
+        (x_near_back, BACKWARD_SLOW),
+        (x_center, STOP),
+        (x_near_front, FORWARD_SLOW),
+        (x_far_front, FORWARD_FAST),
+    ), min_s, scale_x)
+    goal_wy, goal_ay = _aggregate((
+        (y_far_right, RIGHT_FAST),
+        (y_near_right, RIGHT_SLOW),
+        (y_center, STOP),
+        (y_near_left, LEFT_SLOW),
+        (y_far_left, LEFT_FAST),
+    ), min_s, scale_y)
+
+    # Правила обхода препятствий (И = min, ИЛИ = max).
+    # Общие части условий вычисляются один раз; правила с одинаковым
+    # следствием объединены через ИЛИ
+    # Выход влево; при цели прямо по курсу (y center) препятствие тоже обходится слева,
+    # иначе ни одно правило центрального и заднего препятствия не срабатывает
+    y_left = max(y_far_left, y_near_left, y_center)
+    y_right = max(y_far_right, y_near_right)  # Выход вправо
+    front_single = min(lf_s, f_d, rf_s)  # Центральное одно препятствие
+    front_full = min(lf_d, f_d, rf_d)  # Центральное полное блокирование
+    sides_front = min(lr_d, f_d, rr_d)  # Блокирование по бокам и спереди
+
+    obstacle_wx, obstacle_wy, obstacle_ax, obstacle_ay = _aggregate_xy((
+        # ======== ПЕРЕДНИЕ ПРЕПЯТСТВИЯ (X+) ========
+        # Центральное одно препятствие с выходом влево; переднее + правое
+        (max(min(front_single, y_left), min(lf_s, f_d, rf_d)), BACKWARD_MED, LEFT_MED),
+        # Центральное одно препятствие с выходом вправо; переднее + левое
+        (max(min(front_single, y_right), min(lf_d, f_d, rf_s)), BACKWARD_MED, RIGHT_MED),
+        # Полное блокирование спереди или по бокам и спереди с выходом влево
+        (min(max(front_full, sides_front), y_left), BACKWARD_FAST, LEFT_MED),
+        # Полное блокирование спереди или по бокам и спереди с выходом вправо
+        (min(max(front_full, sides_front), y_right), BACKWARD_FAST, RIGHT_MED),
+
+        # ======== ЛЕВЫЕ ПРЕПЯТСТВИЯ (Y+ сторона) ========
+        # Тройное препятствие слева
+        (min(f_d, lf_d, lr_d), STOP, RIGHT_FAST),
+        # Двойное слева, одиночное переднее левое, одиночное левое (при свободном фронте); заднее левое
+        (max(min(f_s, max(min(lf_d, lr_d), min(lf_d, lr_s), min(lf_s, lr_d))),
+             min(bl_d, br_s)), FORWARD_MED, RIGHT_MED),
+
+        # ======== ПРАВЫЕ ПРЕПЯТСТВИЯ (Y- сторона) ========
+        # Тройное препятствие справа
+        (min(f_d, rf_d, rr_d), STOP, LEFT_FAST),
+        # Двойное справа, одиночное переднее правое, одиночное правое (при свободном фронте); заднее правое
+        (max(min(f_s, max(min(rf_d, rr_d), min(rf_d, rr_s), min(rf_s, rr_d))),
+             min(br_d, bl_s)), FORWARD_MED, LEFT_MED),
+
+        # ======== ЗАДНИЕ ПРЕПЯТСТВИЯ (X-) ========
+        # Задняя блокировка с выходом влево или вправо
+        (min(bl_d, br_d, max(y_left, y_right)), FORWARD_FAST, LEFT_MED),
+
+        # ======== Многосторонние препятствия ========
+        # Блокирование по бокам; компенсация бокового смещения при свободном фронте
+        (max(min(lr_d, rr_d), min(max(y_far_left, y_far_right), f_s)), FORWARD_FAST, STOP),
+        # Блокирование по бокам и слева спереди
+        (min(lr_d, lf_d, rr_d), FORWARD_FAST, RIGHT_FAST),
+        # Блокирование по бокам и справа спереди
+        (min(lr_d, rf_d, rr_d), FORWARD_FAST, LEFT_FAST),
+
+        # ======== Приоритет объезда при близкой цели ========
+        (min(x_near_front, lf_d), FORWARD_SLOW, RIGHT_SLOW),
+        (min(x_near_front, rf_d), FORWARD_SLOW, LEFT_SLOW),
+        (min(y_near_left, f_d), BACKWARD_SLOW, RIGHT_SLOW),
+        (min(y_near_right, f_d), BACKWARD_SLOW, LEFT_SLOW),
+    ), min_d)
+
+    return (
+        _defuzzify(goal_wx + obstacle_wx, goal_ax + obstacle_ax),
+        _defuzzify(goal_wy + obstacle_wy, goal_ay + obstacle_ay)
+    )
@@ -1,48 +1,72 @@
+import orjson
 import requests
-import socket
+from requests.adapters import HTTPAdapter
+import logging
+import logging.handlers
 import math
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from navigation import NavigationController
 
 # =====Глобальные настройки=====
 ROBOT_IP = '192.168.0.1'
-CONTROL_PORT = 80
+HTTP_TIMEOUT = 0.05  # Таймаут HTTP запросов (с), меньше нескольких тактов цикла
+URL_SENSORS = f"http://{ROBOT_IP}/data/distancesensorarray"
+URL_ODOMETRY = f"http://{ROBOT_IP}/data/odometry"
+URL_OMNIDRIVE = f"http://{ROBOT_IP}/data/omnidrive"
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 POINT_X = 1.0
 POINT_Y = 1.0
+POINT_TOLERANCE = 0.02  # Допустимая погрешность достижения цели (м)
+POINT_TOLERANCE_SQ = POINT_TOLERANCE ** 2  # Квадрат погрешности, чтобы не вычислять корень каждый такт
 
 # MAX_VELOCITY = 0.30
 MAX_VELOCITY = 0.30
 MIN_VELOCITY = 0.05
 
+CONTROL_PERIOD = 0.02  # Период цикла управления (с), 50 Гц
+SPIN_TIME = 0.0005  # Последний участок ожидания выполняется активно по perf_counter (с)
+
+COMMAND_DEADBAND = 0.005  # Изменение скорости (м/с), меньше которого команда не переотправляется
+COMMAND_WATCHDOG = 0.1  # Максимальный интервал между отправками команд (с)
+
+LOG_LEVEL = logging.INFO  # logging.DEBUG - вывод скоростей и сенсоров каждый такт
+
 
 # =====Глобальные настройки=====
 
-def CONNECT():
-    try:
-        connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)  # Создание сокета TCP
-        connection.connect((ROBOT_IP, CONTROL_PORT))  # Подключение к роботу по HTTP
-        print("Соединение установлено.")
-        return connection
-    except Exception as error:
-        print(f"Ошибка подключения: {error}")
-        return None
+# Общая HTTP сессия: keep-alive соединения с роботом переиспользуются между тактами
+SESSION = requests.Session()
+SESSION.headers.update({'Connection': 'keep-alive'})
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+LOG = logging.getLogger(__name__)
+
+# Потоки для параллельного чтения одометрии и сенсоров
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+# Отдельный поток для отправки команд: такт не ждёт ответа робота на POST
+COMMAND_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Последняя отправленная команда движения и время её отправки
+last_command = None
+last_command_time = 0.0
 
 
 def read_proximity_sensors():
     """Чтение данных с массива датчиков расстояния."""
     try:
-        url = f"http://{ROBOT_IP}/data/distancesensorarray"  # Ссылка для обращения
-        response = requests.get(url)  # Отправка GET запроса по адреу url с получением ответа
+        response = SESSION.get(URL_SENSORS, timeout=HTTP_TIMEOUT)  # Отправка GET запроса по адреу URL_SENSORS с получением ответа
         # Проверка статуса запроса (200 - успех в HTTP)
         if response.status_code != 200:
-            print(f"Ошибка HTTP: {response.status_code}")
+            LOG.error("Ошибка HTTP: %s", response.status_code)
             return None
 
-        sensor_data = response.json()  # Парсинг ответа и преобразование его в массив
+        sensor_data = orjson.loads(response.content)  # Парсинг ответа и преобразование его в массив
         if len(sensor_data) != 9:
-            print("Неверное количество сенсоров!")
+            LOG.error("Неверное количество сенсоров!")
             return None
         # Обработка массива-ответа и возврат его
         return (
@@ -56,33 +80,54 @@ def read_proximity_sensors():
         )
 
     except Exception as error:
-        print(f"Сбой датчиков: {error}")
+        LOG.error("Сбой датчиков: %s", error)
         return None
 
 
 def fetch_odometry():
     """Получение данных одометрии."""
     try:
-        response = requests.get(f"http://{ROBOT_IP}/data/odometry")
-        if response.status_code == 200 and len(response.json()) == 7:
-            return response.json()
-        print("Ошибка одометрии!")
+        response = SESSION.get(URL_ODOMETRY, timeout=HTTP_TIMEOUT)
+        if response.status_code == 200:
+            odometry = orjson.loads(response.content)  # Ответ разбирается один раз
+            if len(odometry) == 7:
+                return odometry
+        LOG.error("Ошибка одометрии!")
     except Exception as error:
-        print(f"Сбой одометрии: {error}")
+        LOG.error("Сбой одометрии: %s", error)
     return None
 
 
-def set_movement_velocity(vx, vy, omega):
+def set_movement_velocity(vx, vy, omega, force=False):
     """Отправка команд движения."""
+    global last_command, last_command_time
+
+    now = time.perf_counter()
+    # Почти не изменившаяся команда не отправляется, пока не истёк COMMAND_WATCHDOG
+    if not force and last_command is not None and now - last_command_time < COMMAND_WATCHDOG:
+        last_vx, last_vy, last_omega = last_command
+        if (max(abs(vx - last_vx), abs(vy - last_vy)) <= COMMAND_DEADBAND
+                and omega == last_omega):
+            return
+
     try:
-        # Отправка скоростей по координатам на робота в формате json файла
-        response = requests.post(
-            f"http://{ROBOT_IP}/data/omnidrive",
-            json=[vx, vy, omega]
+        # Отправка скоростей по координатам на робота в формате json (тело сериализуется orjson)
+        response = SESSION.post(
+            URL_OMNIDRIVE,
+            data=orjson.dumps([vx, vy, omega]),
+            headers=JSON_HEADERS,
+            timeout=HTTP_TIMEOUT
         )
-        print(f"Скорости: X={vx:.2f}, Y={vy:.2f}, Ω={omega} | Ответ: {response.text}")
+        # Запоминается только принятая роботом команда, иначе она повторится на следующем такте
+        if response.status_code != 200:
+            LOG.error("Ошибка HTTP: %s", response.status_code)
+            return
+        last_command = (vx, vy, omega)
+        last_command_time = now
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Скорости: X=%.2f, Y=%.2f, Ω=%s | Ответ: %s", vx, vy, omega, response.text)
     except Exception as error:
-        print(f"Ошибка отправки: {error}")
+        LOG.error("Ошибка отправки: %s", error)
 
 
 def calculate_position_offset(current_x, current_y):
@@ -91,19 +136,36 @@ def calculate_position_offset(current_x, current_y):
 
 
 def stop():
-    set_movement_velocity(0, 0, 0)
+    # Через поток команд, чтобы остановка гарантированно ушла после уже отправляемой команды
+    COMMAND_EXECUTOR.submit(set_movement_velocity, 0, 0, 0, force=True).result()
+
+
+def wait_next_tick(deadline):
+    """Ожидание конца такта. Возвращает дедлайн следующего такта."""
+    slack = deadline - time.perf_counter()
+    if slack < 0:
+        # Такт не уложился в период: пропускаем опоздавшие такты, сохраняя фазу
+        return deadline + CONTROL_PERIOD * math.ceil(-slack / CONTROL_PERIOD)
+    if slack > 1e-3:
+        time.sleep(slack - SPIN_TIME)  # Грубое ожидание средствами ОС
+    while time.perf_counter() < deadline:
+        pass  # Точное ожидание без погрешности планировщика
+    return deadline + CONTROL_PERIOD
+
+
+def setup_logging():
+    """Настройка логирования: вывод в консоль выполняет фоновый поток, цикл управления не ждёт I/O."""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=LOG_LEVEL, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    return listener
 
 
 def main_control_loop():
     """Главный цикл управления."""
-    POINT_TOLERANCE = 0.02
     # Создаём экземпляр класс NavigationController()
     nav = NavigationController()
-    robot_connection = CONNECT()  # Подключаемся к Rabotino
-
-    if not robot_connection:
-        print("Невозможно подключиться!")
-        return
 
     try:
         # Блок выполняется один раз при старте программы, оносительно него потом сравнение идёт
@@ -113,14 +175,19 @@ def main_control_loop():
 
         base_x, base_y = odom_init[0], odom_init[1]  # Извлечение из массива координат (текущих)
 
+        command_future = None
+        deadline = time.perf_counter() + CONTROL_PERIOD
         while True:
-            current_odom = fetch_odometry()
+            # Одометрия и сенсоры запрашиваются параллельно: такт ждёт самый долгий запрос, а не их сумму
+            odom_future = EXECUTOR.submit(fetch_odometry)
+            sensors_future = EXECUTOR.submit(read_proximity_sensors)
+            current_odom = odom_future.result()
+            sensors = sensors_future.result()  # сбор данных с сенсоров
             if not current_odom:
                 continue
             # вычисление смещения координат
             current_x = current_odom[0] - base_x
             current_y = current_odom[1] - base_y
-            sensors = read_proximity_sensors()  # сбор данных с сенсоров
             # если данных нет, то
             if not sensors:
                 time.sleep(1)
@@ -130,25 +197,34 @@ def main_control_loop():
             vx, vy = nav.calculate_velocity(delta_x, delta_y,
                                             *sensors)  # Направка данных на блок фазификации/дефазификации и после возврат скоростей
 
-            distance = math.hypot(delta_x, delta_y)  # Функция вычисления евклидово расстояния
-            if distance <= POINT_TOLERANCE:
+            # Сравнение квадрата евклидова расстояния с квадратом погрешности
+            if delta_x * delta_x + delta_y * delta_y <= POINT_TOLERANCE_SQ:
                 stop()
-                print("Задача выполнена")
+                LOG.info("Задача выполнена")
                 break
 
             # Ограничение скорости (если поменяли лимиты скорости, но не изменили фазификацию)
             vx = max(min(vx, MAX_VELOCITY), -MAX_VELOCITY)
             vy = max(min(vy, MAX_VELOCITY), -MAX_VELOCITY)
-            # Передача управлющего воздейсвия
-            set_movement_velocity(vx, vy, 0)
-            time.sleep(0.02)
+            # Передача управлющего воздейсвия; пока предыдущая команда в пути, новая не ставится
+            # в очередь (следующий такт отправит более свежую)
+            if command_future is None or command_future.done():
+                command_future = COMMAND_EXECUTOR.submit(set_movement_velocity, vx, vy, 0)
+            deadline = wait_next_tick(deadline)
 
     except KeyboardInterrupt:
-        print("Прервано пользователем.")
+        LOG.info("Прервано пользователем.")
     finally:
         stop()
-        robot_connection.close()
 
 
 if __name__ == "__main__":
-    main_control_loop()
\ No newline at end of file
+    log_listener = setup_logging()
+    try:
+        main_control_loop()
+    finally:
+        # Общие ресурсы модуля освобождаются один раз при завершении программы
+        EXECUTOR.shutdown()
+        COMMAND_EXECUTOR.shutdown()
+        SESSION.close()
+        log_listener.stop()
\ No newline at end of file
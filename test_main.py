@@ -0,0 +1,92 @@
+import pytest
+
+import main
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ''
+
+
+class FakeSession:
+    """Заглушка SESSION: запоминает тела POST запросов и отвечает заданным статусом."""
+
+    def __init__(self):
+        self.status_code = 200
+        self.posts = []
+
+    def post(self, url, data, headers, timeout):
+        self.posts.append(data)
+        return FakeResponse(self.status_code)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(main, 'SESSION', fake)
+    monkeypatch.setattr(main, 'last_command', None)
+    monkeypatch.setattr(main, 'last_command_time', 0.0)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Управляемое время main.time.perf_counter: тест сам выставляет now[0]."""
+    now = [100.0]
+    monkeypatch.setattr(main.time, 'perf_counter', lambda: now[0])
+    return now
+
+
+def test_command_within_deadband_is_skipped(session, clock):
+    main.set_movement_velocity(0.1, 0.1, 0)
+    clock[0] += main.COMMAND_WATCHDOG / 2
+    main.set_movement_velocity(0.1 + main.COMMAND_DEADBAND / 2, 0.1, 0)
+    assert len(session.posts) == 1
+
+
+def test_command_outside_deadband_is_sent(session, clock):
+    main.set_movement_velocity(0.1, 0.1, 0)
+    main.set_movement_velocity(0.1 + 2 * main.COMMAND_DEADBAND, 0.1, 0)
+    assert len(session.posts) == 2
+
+
+def test_command_resent_after_watchdog(session, clock):
+    main.set_movement_velocity(0.1, 0.1, 0)
+    clock[0] += main.COMMAND_WATCHDOG + 0.001
+    main.set_movement_velocity(0.1, 0.1, 0)
+    assert len(session.posts) == 2
+
+
+def test_command_resent_after_error_response(session, clock):
+    session.status_code = 500
+    main.set_movement_velocity(0.1, 0.1, 0)
+    session.status_code = 200
+    main.set_movement_velocity(0.1, 0.1, 0)
+    main.set_movement_velocity(0.1, 0.1, 0)
+    assert len(session.posts) == 2
+
+
+def test_forced_command_always_sent(session, clock):
+    main.set_movement_velocity(0, 0, 0)
+    main.set_movement_velocity(0, 0, 0, force=True)
+    main.set_movement_velocity(0, 0, 0, force=True)
+    assert len(session.posts) == 3
+
+
+def test_overrun_tick_keeps_phase(clock, monkeypatch):
+    monkeypatch.setattr(main.time, 'sleep', pytest.fail)  # Опоздавший такт не ждёт
+    deadline = clock[0]
+    clock[0] += 2.5 * main.CONTROL_PERIOD
+    next_deadline = main.wait_next_tick(deadline)
+    assert next_deadline > clock[0]
+    assert next_deadline == pytest.approx(deadline + 3 * main.CONTROL_PERIOD)
+
+
+def test_tick_on_time_advances_one_period(clock, monkeypatch):
+    def sleep(seconds):
+        clock[0] += seconds + main.SPIN_TIME  # ОС будит поток после дедлайна
+
+    monkeypatch.setattr(main.time, 'sleep', sleep)
+    deadline = clock[0] + main.CONTROL_PERIOD / 2
+    assert main.wait_next_tick(deadline) == deadline + main.CONTROL_PERIOD
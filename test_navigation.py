@@ -0,0 +1,83 @@
+import pytest
+
+from navigation import NavigationController
+
+FREE = 0.41  # Свободно: предел дальности сенсора
+NEAR = 0.1  # Препятствие в опасной зоне
+
+# Скорости исходного контроллера на skfuzzy (центроид) при свободном пути:
+# отклонение d по обеим осям -> (vx, vy)
+BASELINE_GOAL = [
+    (0.1, 0.0613),
+    (-0.1, -0.0613),
+    (0.235, 0.179),
+    (-0.235, -0.1872),
+    (1.0, 0.2498),
+    (-1.0, -0.2548),
+    (1.99, 0.2451),
+    (-1.99, -0.2501),
+    (2.5, 0.2451),
+    (3.0, 0.2451),
+]
+
+# Синглтоны вместо центроида дают расхождение до 0.0185 м/с (на переходе
+# near -> far при |d| = 0.20-0.25 м, максимум около 0.237 м)
+TOLERANCE = 0.02
+
+# Режим обхода исходного контроллера при цели d = (0.5, 0.5) (после такта движения к цели):
+# сенсоры (left_front, left_rear, front, right_front, right_rear, back_left, back_right) -> (vx, vy)
+BASELINE_OBSTACLE = [
+    ((FREE, FREE, NEAR, FREE, FREE, FREE, FREE), (-0.16, 0.16)),  # спереди
+    ((NEAR, FREE, NEAR, FREE, FREE, FREE, FREE), (-0.16, -0.16)),  # спереди и слева спереди
+    ((FREE, FREE, NEAR, NEAR, FREE, FREE, FREE), (-0.16, 0.16)),  # спереди и справа спереди
+    ((NEAR, NEAR, NEAR, FREE, FREE, FREE, FREE), (-0.127, -0.2048)),  # тройное слева
+    ((NEAR, FREE, FREE, FREE, FREE, FREE, FREE), (0.1996, -0.127)),  # слева спереди
+    ((FREE, NEAR, FREE, FREE, NEAR, FREE, FREE), (0.1996, 0.0)),  # по бокам
+    ((FREE, FREE, FREE, FREE, FREE, NEAR, NEAR), (0.2498, 0.127)),  # сзади с обеих сторон
+]
+
+# Правила обхода, которые в исходном контроллере не срабатывали так, как задумано
+# (лишнее | near_* из-за приоритета & над |) или объединены через ИЛИ:
+# (dx, dy), сенсоры -> синглтоны (vx, vy)
+OBSTACLE_RULES = [
+    # Одиночное правое/левое: раньше (-0.008, 0.0) - правило тонуло в | near_right
+    ((1.0, -0.1), (FREE, FREE, FREE, FREE, NEAR, FREE, FREE), (0.16, 0.16)),
+    ((1.0, -0.19), (FREE, FREE, FREE, FREE, NEAR, FREE, FREE), (0.16, 0.16)),
+    ((1.0, 0.1), (FREE, NEAR, FREE, FREE, FREE, FREE, FREE), (0.16, -0.16)),
+    # Двойное, одиночное переднее и заднее с одной стороны: одно правило на сторону
+    ((1.0, 0.1), (NEAR, NEAR, FREE, FREE, FREE, FREE, FREE), (0.16, -0.16)),
+    ((1.0, 0.1), (NEAR, FREE, FREE, FREE, FREE, FREE, FREE), (0.16, -0.16)),
+    ((1.0, 0.1), (FREE, FREE, FREE, FREE, FREE, NEAR, FREE), (0.16, -0.16)),
+    ((1.0, -0.1), (FREE, FREE, FREE, NEAR, NEAR, FREE, FREE), (0.16, 0.16)),
+    ((1.0, -0.1), (FREE, FREE, FREE, NEAR, FREE, FREE, FREE), (0.16, 0.16)),
+    ((1.0, -0.1), (FREE, FREE, FREE, FREE, FREE, FREE, NEAR), (0.16, 0.16)),
+    # Переднее с боковым: выход в сторону от бокового препятствия при любом dy
+    ((0.5, -0.5), (FREE, FREE, NEAR, NEAR, FREE, FREE, FREE), (-0.16, 0.16)),
+    ((0.5, 0.5), (NEAR, FREE, NEAR, FREE, FREE, FREE, FREE), (-0.16, -0.16)),
+    # Полное блокирование спереди
+    ((0.5, 0.5), (NEAR, FREE, NEAR, NEAR, FREE, FREE, FREE), (-0.26, 0.16)),
+    # Цель прямо по курсу (dy в center): переднее и заднее препятствие обходятся слева
+    ((0.5, 0.0), (FREE, FREE, NEAR, FREE, FREE, FREE, FREE), (-0.16, 0.16)),
+    ((0.5, 0.0), (FREE, FREE, FREE, FREE, FREE, NEAR, NEAR), (0.26, 0.16)),
+]
+
+
+@pytest.mark.parametrize("d, expected", BASELINE_GOAL)
+def test_goal_velocity_matches_baseline(d, expected):
+    vx, vy = NavigationController().calculate_velocity(d, d, *(FREE,) * 7)
+    assert vx == pytest.approx(expected, abs=TOLERANCE)
+    assert vy == pytest.approx(expected, abs=TOLERANCE)
+
+
+@pytest.mark.parametrize("sensors, expected", BASELINE_OBSTACLE)
+def test_obstacle_velocity_matches_baseline(sensors, expected):
+    vx, vy = NavigationController().calculate_velocity(0.5, 0.5, *sensors)
+    assert vx == pytest.approx(expected[0], abs=TOLERANCE)
+    assert vy == pytest.approx(expected[1], abs=TOLERANCE)
+
+
+@pytest.mark.parametrize("d, sensors, expected", OBSTACLE_RULES)
+def test_obstacle_rules(d, sensors, expected):
+    vx, vy = NavigationController().calculate_velocity(*d, *sensors)
+    assert vx == pytest.approx(expected[0])
+    assert vy == pytest.approx(expected[1])